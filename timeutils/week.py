@@ -1,7 +1,12 @@
 from datetime import date
+from datetime import MAXYEAR
+from datetime import MINYEAR
 from datetime import timedelta
 from enum import IntEnum
+from functools import lru_cache
+import operator
 from typing import Iterable
+from typing import List
 
 
 class Weekday(IntEnum):
@@ -14,7 +19,7 @@ class Weekday(IntEnum):
     SUNDAY = 7
 
     def __repr__(self) -> str:
-        return f'{type(self).__name__}.{self.name}'
+        return _WEEKDAY_REPRS[self._value_ - 1]
 
     def __add__(self, other: int) -> 'Weekday':
         """
@@ -26,8 +31,16 @@ class Weekday(IntEnum):
             Weekday.MONDAY
             >>> Weekday.SUNDAY + 3
             Weekday.WEDNESDAY
+            >>> all(Weekday(a) + k - k is Weekday(a) for a in range(1, 8) for k in range(-14, 15))
+            True
+            >>> Weekday.MONDAY + 1.0
+            Weekday.TUESDAY
         """
-        return type(self)((self.value + other - 1) % 7 + 1)
+        try:
+            return _WEEKDAYS[(self._value_ + other - 1) % 7]
+        except TypeError:
+            # non-int offsets (e.g. `1.0`) can't index the table, let the enum resolve them
+            return type(self)((self._value_ + other - 1) % 7 + 1)
 
     def __sub__(self, other):
         """
@@ -39,15 +52,17 @@ class Weekday(IntEnum):
             2
             >>> Weekday.TUESDAY - Weekday.THURSDAY
             5
+            >>> all(b + (a - b) is a for a in Weekday for b in Weekday)
+            True
         """
         if isinstance(other, type(self)):
-            return (int(self) - int(other)) % 7
+            return (self._value_ - other._value_) % 7
         else:
             return self + (-other)
 
     @classmethod
     def for_date(cls, date_: date):
-        return cls(date_.isoweekday())
+        return _WEEKDAYS[date_.isoweekday() - 1]
 
     def first_of_year(self, year: int) -> date:
         """
@@ -69,9 +84,53 @@ class Weekday(IntEnum):
             datetime.date(2006, 1, 5)
             >>> Weekday.THURSDAY.first_of_year(2010)
             datetime.date(2010, 1, 7)
+            >>> Weekday.MONDAY.first_of_year(0)
+            Traceback (most recent call last):
+            ...
+            ValueError: year 0 is out of range
+            >>> Weekday.MONDAY.first_of_year(10000)
+            Traceback (most recent call last):
+            ...
+            ValueError: year 10000 is out of range
+            >>> Weekday.MONDAY.first_of_year(2022.0)
+            Traceback (most recent call last):
+            ...
+            TypeError: 'float' object cannot be interpreted as an integer
+            >>> Weekday.MONDAY.first_of_year(2022)
+            datetime.date(2022, 1, 3)
         """
-        day = 1 + (self.value - date(year, 1, 1).isoweekday()) % 7
-        return date(year, 1, day)
+        # normalize before hitting the cache, where `2022.0` and `2022` would share a key
+        year = operator.index(year)
+        return date.fromordinal(_first_of_year_ord(self._value_ % 7, year))
+
+
+# members in order, indexed by `value - 1`
+_WEEKDAYS = tuple(Weekday)
+_WEEKDAY_REPRS = tuple(f'{type(weekday).__name__}.{weekday.name}' for weekday in _WEEKDAYS)
+
+
+def _jan_1_ord(year: int) -> int:
+    # same as `date(year, 1, 1).toordinal()`, in plain int arithmetic
+    y = year - 1
+    return 365 * y + y // 4 - y // 100 + y // 400 + 1
+
+
+@lru_cache(maxsize=4096)
+def _first_of_year_ord(weekday: int, year: int) -> int:
+    # same as `Weekday.first_of_year` but returning an ordinal;
+    # ordinal 1 (0001-01-01) is a monday, so ordinals are congruent to iso weekdays mod 7,
+    # and `weekday` is passed as that residue (`ordinal % 7`, 0 for sunday) to share cache entries
+    if not MINYEAR <= year <= MAXYEAR:
+        raise ValueError(f'year {year} is out of range')
+    jan_1_ord = _jan_1_ord(year)
+    return jan_1_ord + (weekday - jan_1_ord) % 7
+
+
+def _week_number(start_ord: int, year: int) -> int:
+    # number of the week starting on given ordinal and belonging to given year
+    midday_ord = start_ord + 3
+    first_midday_ord = _first_of_year_ord(midday_ord % 7, year)
+    return 1 + (midday_ord - first_midday_ord) // 7
 
 
 SEVEN_DAYS = timedelta(days=7)
@@ -100,12 +159,23 @@ class Week:
         True
         >>> date(2021, 1, 25) in w
         False
+        >>> w.start = date(2022, 1, 3)  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        AttributeError: ...
     """
 
-    __slots__ = ('start',)
+    __slots__ = ('_start', '_ord', '_year')
 
     def __init__(self, start: date):
-        self.start = start
+        self._start = start
+        self._ord = start.toordinal()
+        self._year = None  # filled in lazily by `year`
+
+    @property
+    def start(self) -> date:
+        # read-only, `_ord` and `_year` are derived from it
+        return self._start
 
     @classmethod
     def with_date(cls, date_: date, first_weekday: Weekday = Weekday.MONDAY) -> 'Week':
@@ -127,7 +197,11 @@ class Week:
             >>> Week.with_date(date(2021, 1, 4), first_weekday=Weekday.SUNDAY)
             Week(datetime.date(2021, 1, 3))
         """
-        return cls(date_ - timedelta(days=(date_.isoweekday() - int(first_weekday)) % 7))
+        ordinal = date_.toordinal()
+        if first_weekday is _WEEKDAYS[0]:
+            # fast path for the default (`_WEEKDAYS[0]` is quicker to fetch than `Weekday.MONDAY`)
+            return cls(date.fromordinal(ordinal - (ordinal - 1) % 7))
+        return cls(date.fromordinal(ordinal - (ordinal - int(first_weekday)) % 7))
 
     @classmethod
     def with_number(cls, year: int, number: int, first_weekday: Weekday = Weekday.MONDAY) -> 'Week':
@@ -149,10 +223,28 @@ class Week:
             Week(datetime.date(2021, 1, 10))
             >>> Week.with_number(2021, 33, first_weekday=Weekday.SUNDAY).number
             33
+
+            >>> Week.with_number(0, 53)
+            Traceback (most recent call last):
+            ...
+            ValueError: year 0 is out of range
+            >>> Week.with_number(10000, 0)
+            Traceback (most recent call last):
+            ...
+            ValueError: year 10000 is out of range
+            >>> Week.with_number(2021.0, 1)
+            Traceback (most recent call last):
+            ...
+            TypeError: 'float' object cannot be interpreted as an integer
+            >>> Week.with_number(2021, 1.0)
+            Week(datetime.date(2021, 1, 4))
         """
         # TODO: handle number out of range? (0? 53?)
-        first_midday = (first_weekday + 3).first_of_year(year)
-        return cls(first_midday + timedelta(days=7 * (number - 1) - 3))
+        year = operator.index(year)  # normalized before hitting the cache
+        first_midday_ord = _first_of_year_ord((int(first_weekday) + 3) % 7, year)
+        if isinstance(number, int):
+            return cls(date.fromordinal(first_midday_ord + 7 * (number - 1) - 3))
+        return cls(date.fromordinal(first_midday_ord) + timedelta(days=7 * (number - 1) - 3))
 
     @classmethod
     def now(cls, first_weekday: Weekday = Weekday.MONDAY) -> 'Week':
@@ -166,7 +258,7 @@ class Week:
 
     @property
     def end(self) -> date:
-        return self.start + SEVEN_DAYS
+        return date.fromordinal(self._ord + 7)
 
     def __len__(self) -> int:
         return len(Weekday)  # 7 :)
@@ -193,7 +285,7 @@ class Week:
             >>> date(2021, 11, 1) in w
             False
         """
-        return self.start <= date_ < self.end
+        return 0 <= date_.toordinal() - self._ord < 7
 
     def __iter__(self):
         """
@@ -203,19 +295,47 @@ class Week:
             >>> ', '.join(str(d) for d in Week.with_number(2021, 30))
             '2021-07-26, 2021-07-27, 2021-07-28, 2021-07-29, 2021-07-30, 2021-07-31, 2021-08-01'
         """
-        for offset in range(len(self)):
-            yield self.start + timedelta(days=offset)
+        for ordinal in range(self._ord, self._ord + len(self)):
+            yield date.fromordinal(ordinal)
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, type(self)) and self.start == other.start
+        return isinstance(other, type(self)) and self._ord == other._ord
 
     def __hash__(self) -> int:
-        return hash((type(self), self.start))
+        return hash(self._ord)
+
+    def __lt__(self, other) -> bool:
+        """
+            >>> w1, w2 = Week(date(2021, 9, 27)), Week(date(2021, 10, 4))
+            >>> w1 < w2, w1 <= w2, w1 > w2, w1 >= w2
+            (True, True, False, False)
+            >>> w1 <= Week(date(2021, 9, 27)) <= w1
+            True
+            >>> sorted([w2, w1]) == [w1, w2]
+            True
+            >>> w1 < date(2021, 10, 4)
+            Traceback (most recent call last):
+            ...
+            TypeError: '<' not supported between instances of 'Week' and 'datetime.date'
+        """
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._ord < other._ord
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._ord <= other._ord
 
     def __gt__(self, other) -> bool:
         if not isinstance(other, type(self)):
-            raise NotImplementedError
-        return self.start > other.start
+            return NotImplemented
+        return self._ord > other._ord
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._ord >= other._ord
 
     def __add__(self, other) -> 'Week':
         """
@@ -230,14 +350,23 @@ class Week:
             Traceback (most recent call last):
             ...
             ValueError: must add only whole weeks
+            >>> w + 1.0
+            Week(datetime.date(2021, 10, 4))
+            >>> w + 1.5
+            Traceback (most recent call last):
+            ...
+            ValueError: must add only whole weeks
         """
+        if isinstance(other, int):
+            return type(self)(date.fromordinal(self._ord + 7 * other))
+
         if not hasattr(other, 'days'):
             other = timedelta(days=7 * other)
 
         if other.days % 7 != 0:
             raise ValueError('must add only whole weeks')
 
-        return type(self)(self.start + other)
+        return type(self)(date.fromordinal(self._ord + other.days))
 
     def __sub__(self, other) -> 'Week':
         """
@@ -252,7 +381,7 @@ class Week:
 
     @property
     def first_weekday(self) -> Weekday:
-        return Weekday.for_date(self.start)
+        return _WEEKDAYS[(self._ord - 1) % 7]
 
     def weekday_date(self, weekday: Weekday) -> date:
         """
@@ -278,8 +407,10 @@ class Week:
             datetime.date(2021, 9, 27)
             >>> w2.weekday_date(Weekday.SATURDAY)
             datetime.date(2021, 10, 2)
+            >>> w2.weekday_date(1)  # plain ints are treated as weekdays too
+            datetime.date(2021, 9, 27)
         """
-        return self.start + timedelta(days=weekday - self.first_weekday)
+        return date.fromordinal(self._ord + (int(weekday) - self._ord) % 7)
 
     @property
     def year(self) -> int:
@@ -291,7 +422,9 @@ class Week:
             >>> Week(date(2024, 12, 30)).year
             2025
         """
-        return (self.start + timedelta(days=3)).year
+        if self._year is None:
+            self._year = date.fromordinal(self._ord + 3).year
+        return self._year
 
     @property
     def number(self) -> int:
@@ -309,9 +442,7 @@ class Week:
             >>> Week(date(2020, 12, 28)).number
             53
         """
-        my_midday = self.start + timedelta(days=3)
-        first_midday = (self.first_weekday + 3).first_of_year(self.year)
-        return 1 + (my_midday - first_midday).days // 7
+        return _week_number(self._ord, self.year)
 
 
 def weeks_of_year(year: int, first_weekday: Weekday = Weekday.MONDAY) -> Iterable[Week]:
@@ -331,11 +462,57 @@ def weeks_of_year(year: int, first_weekday: Weekday = Weekday.MONDAY) -> Iterabl
         (Week(datetime.date(2019, 12, 30)), Week(datetime.date(2020, 12, 28)))
         >>> print(weeks_2020[0], weeks_2020[-1])
         2020-W01 2020-W53
+
+        >>> [len(list(weeks_of_year(y))) for y in range(2013, 2022)]
+        [52, 52, 53, 52, 52, 52, 52, 53, 52]
+        >>> [len(list(weeks_of_year(y, Weekday.SUNDAY))) for y in range(2013, 2022)]
+        [52, 53, 52, 52, 52, 52, 52, 53, 52]
+    """
+    # the year has 53 weeks iff its midday weekday occurs 53 times in it,
+    # i.e. iff it falls on Jan 1 or (in leap years) on Dec 31
+    midday = (int(first_weekday) + 2) % 7 + 1
+    jan_1, dec_31 = date(year, 1, 1).isoweekday(), date(year, 12, 31).isoweekday()
+    weeks_count = 53 if midday in (jan_1, dec_31) else 52
+
+    first_ord = Week.with_number(year, 1, first_weekday)._ord
+    weeks = [Week(date.fromordinal(first_ord + 7 * index)) for index in range(weeks_count)]
+    return iter(weeks)
+
+
+def week_numbers(dates: Iterable[date], first_weekday: Weekday = Weekday.MONDAY) -> List[int]:
+    """
+    Week numbers of given dates, same as `[Week.with_date(d, first_weekday).number for d in dates]`
+    but without constructing any `Week` objects.
+
+        >>> week_numbers([date(2021, 1, 3), date(2021, 1, 4), date(2021, 10, 6)])
+        [53, 1, 40]
+        >>> week_numbers([date(2021, 1, 2), date(2021, 1, 3)], first_weekday=Weekday.SUNDAY)
+        [53, 1]
+        >>> week_numbers([])
+        []
     """
-    w = Week.with_number(year, 1, first_weekday)
-    while w.year <= year:
-        yield w
-        w += SEVEN_DAYS
+    first_weekday = int(first_weekday)
+    midday_weekday = (first_weekday + 3) % 7
+    # ordinal range of the year currently being scanned and its first midday;
+    # refreshed only when a week midday falls outside of it
+    year_start_ord = year_end_ord = first_midday_ord = 0
+    years = {}
+
+    numbers = []
+    for date_ in dates:
+        ordinal = date_.toordinal()
+        midday_ord = ordinal - (ordinal - first_weekday) % 7 + 3
+        if not year_start_ord <= midday_ord < year_end_ord:
+            year = date.fromordinal(midday_ord).year
+            if year not in years:
+                years[year] = (
+                    _jan_1_ord(year),
+                    _jan_1_ord(year + 1),
+                    _first_of_year_ord(midday_weekday, year),
+                )
+            year_start_ord, year_end_ord, first_midday_ord = years[year]
+        numbers.append(1 + (midday_ord - first_midday_ord) // 7)
+    return numbers
 
 
 class WeekRange: